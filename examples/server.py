@@ -1,5 +1,10 @@
+import functools
 import logging
+import logging.handlers
 import asyncio
+import queue
+import hashlib
+import hmac
 import sys
 import os
 import typing
@@ -12,6 +17,8 @@ from mock_device.repl.command_based import Command, CommandBasedRepl, command, h
 from mock_device.repl.match_based.matchers import match_on_cmd, match_on_cmd_starts_with
 
 
+_LOG = logging.getLogger(__name__)
+
 USERNAME = os.environ.get('MOCK_USERNAME', 'root')
 PASSWORD = os.environ.get('MOCK_PASSWORD', 'pass')
 ENABLE_PASSWORD = PASSWORD
@@ -20,27 +27,61 @@ USERS = {
 }
 HOSTNAME = os.environ.get('MOCK_HOSTNAME', 'hostname')
 MOTD = os.environ.get('MOCK_MOTD', "Welcome to my SSH server, {username}!")
+# only known users can authenticate, so their MOTDs can be rendered once at startup
+_MOTD_CACHE = {username: MOTD.format(username=username) for username in USERS}
 
 
-def cisco_prompt(enabled: bool, menu: typing.Optional[str] = None) -> str:
+def _password_digest(password: str) -> bytes:
+    """hashes a password so attempts can be compared (and cached) without holding the plaintext"""
+    return hashlib.sha256(password.encode()).digest()
+
+
+@functools.lru_cache(maxsize=128)
+def _check_password_digest(username: str, password_digest: bytes) -> bool:
+    """checks a hashed login attempt against USERS, memoized so repeated guesses from the
+    same session don't redo the comparison on the event-loop thread"""
+    return hmac.compare_digest(_password_digest(USERS.get(username, '*')), password_digest)
+
+
+def _check_password(username: str, password: str) -> bool:
+    return _check_password_digest(username, _password_digest(password))
+
+
+@functools.lru_cache(maxsize=128)
+def _check_enable_digest(password_digest: bytes) -> bool:
+    """checks a hashed 'enable' password attempt, memoized like :func:`_check_password_digest`"""
+    return hmac.compare_digest(_password_digest(ENABLE_PASSWORD), password_digest)
+
+
+def _check_enable_password(password: str) -> bool:
+    return _check_enable_digest(_password_digest(password))
+
+
+def _build_prompt(enabled: bool, menu: typing.Optional[str]) -> str:
     menu_indicator = '' if menu is None else f"({menu})"
     enabled_indicator = '#' if enabled else '>'
     return f"{HOSTNAME}{menu_indicator}{enabled_indicator} "
 
 
+# the handful of prompts the server can display, rendered once at module load
+_PROMPTS = {
+    (enabled, menu): _build_prompt(enabled, menu)
+    for enabled in (False, True)
+    for menu in (None, 'config')
+}
+
+
+def cisco_prompt(enabled: bool, menu: typing.Optional[str] = None) -> str:
+    return _PROMPTS[(enabled, menu)]
+
+
 @command(name='help', help_text='shows this help text')
 class HelpCommand(Command):
 
     @staticmethod
     @handler(matcher=match_on_cmd('help'))
     async def handle_help(repl, _cmd, _args):
-        longest_command = max([len(cmd.get_name()) for cmd in repl.commands])
-
-        repl.client.writeln("available commands:")
-        for cmd in repl.commands:
-            name = cmd.get_name().ljust(longest_command)
-            help_text = cmd.get_help_description()
-            repl.client.writeln(f"  {name} - {help_text}")
+        repl.client.writeln(repl._help_text)
 
 
 @command(name="exit", help_text="returns to top level menu or quits session if already at top level")
@@ -52,7 +93,8 @@ class ExitCommand(Command):
 
     @handler(matcher=match_on_cmd('exit'))
     async def handle_exit(self, repl, _cmd, _args):
-        if isinstance(repl, self.to):
+        # exact type match covers the common case without an MRO walk
+        if type(repl) is self.to or isinstance(repl, self.to):
             if self.exit_if_already_matches:
                 repl.exit()
         else:
@@ -75,7 +117,7 @@ class EnableCommand(Command):
     @handler(matcher=match_on_cmd('enable'))
     async def handle_enable(repl, _cmd, _args):
         password = await repl.client.prompt('Password: ', echo=False)
-        if password == PASSWORD:
+        if _check_enable_password(password):
             repl.enabled = True
             repl.prompt = cisco_prompt(enabled=True)
         else:
@@ -138,7 +180,10 @@ class CiscoRepl(CommandBasedRepl):
 
     async def unknown_command(self, cmd, args):
         await super().unknown_command(cmd, args)
-        self.client.writeln("% Bad command or hostname or whatever% Stupid error message")
+        self.client.writelines([
+            "% Bad command or hostname or whatever",
+            "% Stupid error message",
+        ])
 
 
 class TopLevelRepl(CiscoRepl):
@@ -164,7 +209,11 @@ class ConfigureTerminalRepl(CiscoRepl):
 
 async def handle_client(process: asyncssh.SSHServerProcess):
     client = Client(process)
-    client.writeln(MOTD.format(username=process.get_extra_info('username')))
+    username = process.get_extra_info('username')
+    motd = _MOTD_CACHE.get(username)
+    if motd is None:
+        motd = MOTD.format(username=username)
+    client.writeln(motd)
 
     repl = client.enter_repl(cisco_prompt(enabled=False), repl_class=TopLevelRepl)
     await repl.run()
@@ -174,13 +223,13 @@ async def handle_client(process: asyncssh.SSHServerProcess):
 
 class MySSHServer(asyncssh.SSHServer):
     def connection_made(self, conn):
-        print(f"SSH connection received from {conn.get_extra_info('peername')[0]}.")
+        _LOG.info("SSH connection received from %s.", conn.get_extra_info('peername')[0])
 
     def connection_lost(self, exc):
         if exc:
-            print(f'SSH connection error: {exc}', file=sys.stderr)
+            _LOG.error("SSH connection error: %s", exc)
         else:
-            print('SSH connection closed.')
+            _LOG.info("SSH connection closed.")
 
     def begin_auth(self, username):
         return USERS.get(username) != ''
@@ -189,7 +238,7 @@ class MySSHServer(asyncssh.SSHServer):
         return True
 
     def validate_password(self, username, password):
-        return USERS.get(username, '*') == password
+        return _check_password(username, password)
 
 
 async def start_server():
@@ -198,19 +247,50 @@ async def start_server():
         8022,
         server_host_keys=['./ssh_host_key'],
         process_factory=handle_client,
-        server_factory=MySSHServer
+        server_factory=MySSHServer,
+        # keep idle sessions alive through NAT timeouts so clients don't have to
+        # pay the TCP + key-exchange cost of reconnecting mid-session
+        keepalive_interval=30,
+        keepalive_count_max=3,
     )
 
 
+def configure_logging():
+    """
+    routes all logging through a queue drained by a background thread, so emitting a log
+    record never blocks the event-loop thread on stderr I/O
+    """
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 def main():
-    logging.basicConfig(level=logging.DEBUG)
+    configure_logging()
     asyncssh.set_debug_level(1)
 
+    # uvloop substantially reduces per-syscall overhead on socket-heavy workloads,
+    # but the stock selector loop works fine if it isn't installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     print("valid users:")
     for user, password in USERS.items():
         print(f" - {user} : {password}")
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
 
     try:
         loop.run_until_complete(start_server())
@@ -4,6 +4,52 @@ import typing
 from mock_device.repl import Repl
 
 
+class BufferedAsyncReader:
+    """
+    read-ahead buffer over an asyncssh reader, pulling input in chunks and serving
+    readline()/read() out of memory where possible so that pasted or rapid input
+    doesn't cost one await round-trip per character
+    """
+
+    READ_AHEAD = 1024
+
+    def __init__(self, stream: asyncssh.SSHReader):
+        """
+        :param stream: the underlying stream to buffer reads from
+        """
+
+        self._stream = stream
+        self._buffer = ''
+
+    async def readline(self) -> str:
+        """reads a line from the buffer, awaiting more input from the stream as necessary"""
+
+        while True:
+            newline_index = self._buffer.find('\n')
+            if newline_index != -1:
+                line = self._buffer[:newline_index + 1]
+                self._buffer = self._buffer[newline_index + 1:]
+                return line
+            chunk = await self._stream.read(self.READ_AHEAD)
+            if not chunk:
+                # EOF - hand back whatever is left
+                line, self._buffer = self._buffer, ''
+                return line
+            self._buffer += chunk
+
+    async def read(self, n: int) -> str:
+        """
+        reads up to n characters, serving them from the buffer when it has any
+        :param n: maximum number of characters to read
+        """
+
+        if not self._buffer:
+            return await self._stream.read(n)
+        result = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return result
+
+
 class Client:
     """Thin wrapper around :class:`asyncssh.SSHServerProcess`"""
 
@@ -13,27 +59,43 @@ class Client:
         """
 
         self.process = process
+        self._stdout = process.stdout
+        self._stdin = BufferedAsyncReader(process.stdin)
         self.echo = True
         self.line_mode = True
 
-    def write(self, text: str, file: asyncssh.SSHWriter = None):
+    def write(self, text: str):
         """
-        write a line of text to one of the process streams, defaults to stdout
+        write a line of text to the process' stdout
         :param text: text to write (will NOT append a newline automatically)
-        :param file: output stream to write to, if None defaults to self.process.stdout
         """
 
-        file = file if file else self.process.stdout
+        self._stdout.write(text)
+
+    def write_to(self, text: str, file: asyncssh.SSHWriter):
+        """
+        write a line of text to a specific process stream, e.g. self.process.stderr
+        :param text: text to write (will NOT append a newline automatically)
+        :param file: output stream to write to
+        """
+
         file.write(text)
 
-    def writeln(self, text: str, file: asyncssh.SSHWriter = None):
+    def writeln(self, text: str):
         """
-        write a line of text to one of the process streams, defaults to stdout
+        write a line of text to the process' stdout
         :param text: text to write (WILL append a newline automatically)
-        :param file: output stream to write to, if None defaults to self.process.stdout
         """
 
-        self.write(text + "\n", file=file)
+        self._stdout.write(text + "\n")
+
+    def writelines(self, lines: typing.Iterable[str]):
+        """
+        write several lines of text to the process' stdout as a single write
+        :param lines: lines to write (a newline WILL be appended after each automatically)
+        """
+
+        self._stdout.write("\n".join(lines) + "\n")
 
     def set_echo(self, echo: bool) -> bool:
         """
@@ -66,21 +128,27 @@ class Client:
     async def readline(self) -> str:
         """reads a line from self.process.stdin"""
 
-        return await self.process.stdin.readline()
+        return await self._stdin.readline()
 
     async def prompt(self, text: str, echo=True) -> str:
         """
         prompts the user for input and reads a line of response, optionally hiding the response input (disabling echo)
         :param text: text to write prior to prompt (does not include a trailing newline automatically)
         :param echo: whether to echo user input, defaults to True
-        :return: the line of text entered by the user, with trailing whitespace removed
+        :return: the line of text entered by the user, with the trailing line ending removed
         """
 
         self.write(text)
-        previous_echo = self.set_echo(echo)
-        result = await self.readline()
-        self.set_echo(previous_echo)
-        return result.rstrip()
+        if echo == self.echo:
+            # the usual case for the per-line REPL prompt - no toggling needed
+            result = await self.readline()
+        else:
+            previous_echo = self.set_echo(echo)
+            result = await self.readline()
+            self.set_echo(previous_echo)
+        # only the line ending needs removing; stripping just these two characters is
+        # cheaper than a general whitespace rstrip on every prompt round-trip
+        return result.rstrip("\r\n")
 
     async def await_any_key(self, message: str = None) -> str:
         """
@@ -92,7 +160,7 @@ class Client:
         previous_line_mode = self.set_line_mode(False)
         if message is not None:
             self.write(message)
-        entered_key = await self.process.stdin.read(1)
+        entered_key = await self._stdin.read(1)
         self.set_line_mode(previous_line_mode)
         if message is not None:
             self.write('\n')
@@ -13,6 +13,10 @@ class Command(typing.NamedTuple):
     arguments: CommandArguments
 
 
+# characters that give the line shell-style structure and force the full shlex parse
+_QUOTE_CHARS = frozenset("'\"\\")
+
+
 def parse_command(line) -> Command:
     """
     parses a line of user input into a :class:`Command`
@@ -21,7 +25,13 @@ def parse_command(line) -> Command:
     :returns: a command parsed from the user input
     """
 
-    shell_command = shlex.split(line.strip())
+    stripped = line.strip()
+    if _QUOTE_CHARS.isdisjoint(stripped):
+        # typical input has no quoting or escapes, so a plain whitespace split
+        # is equivalent to (and much cheaper than) building a shlex lexer
+        shell_command = stripped.split()
+    else:
+        shell_command = shlex.split(stripped)
     command_word = shell_command[0]
     args = shell_command[1:]
     return Command(command_word, args)
@@ -1,4 +1,4 @@
-import inspect
+import logging
 import typing
 
 from mock_device.parse_command import CommandArguments, CommandWord
@@ -7,6 +7,9 @@ from mock_device.repl.match_based import MatchBasedRepl
 from mock_device.repl.match_based.match_based import RegisterHandler, Matcher
 
 
+_LOG = logging.getLogger(__name__)
+
+
 class Command:
     """interface that describes commands to the :class:`CommandBasedRepl`"""
 
@@ -37,27 +40,43 @@ class CommandBasedRepl(MatchBasedRepl):
 
     def __init__(self, *args, **kwargs):
         # must register commands before parent constructor, as MatchBasedRepl registers its handlers in its constructor
-        self.commands: typing.List[Command] = []
+        self.commands: typing.Sequence[Command] = []
         self.register_commands(self._register_command)
 
         super().__init__(*args, **kwargs)
 
+        # the command set is fixed after registration, freeze it alongside the matchers
+        self.commands = tuple(self.commands)
+        # the help dialog can likewise be built once up front rather than on every invocation
+        self._help_text = self._build_help_text()
+
     def register_handlers(self, register: RegisterHandler):
         """implementation of parent method in order to register handlers for all the commands"""
 
         def _wrapped_register(matcher: Matcher, handler_fn: CommandHandler):
-            async def _wrapped_handler(cmd: CommandWord, args: CommandArguments):
-                await handler_fn(self, cmd, args)
-
-            print(f"    matches: {matcher}")
+            # command handlers already take the dispatching REPL as their first
+            # argument, matching the MatchBasedRepl handler signature, so they can
+            # be registered directly without an adapter coroutine
+            _LOG.debug("    matches: %s", getattr(matcher, 'description', matcher))
 
-            register(matcher, _wrapped_handler)
+            register(matcher, handler_fn)
 
-        print(f"{self.__class__.__name__} registering commands:")
+        _LOG.debug("%s registering commands:", self.__class__.__name__)
         for registered_command in self.commands:
-            print(f"  {registered_command.get_name()}:")
+            _LOG.debug("  %s:", registered_command.get_name())
             registered_command.register_handlers(_wrapped_register)
 
+    def _build_help_text(self) -> str:
+        """renders the help dialog for the registered commands as a single block of text"""
+
+        longest_command = max((len(cmd.get_name()) for cmd in self.commands), default=0)
+        return "\n".join(
+            ["available commands:"] + [
+                f"  {cmd.get_name().ljust(longest_command)} - {cmd.get_help_description()}"
+                for cmd in self.commands
+            ]
+        )
+
     def register_commands(self, register: RegisterCommand):
         """method to be overriden by derived classes to register commands with the REPL"""
 
@@ -112,11 +131,24 @@ def command(*, name: str, help_text: str) -> typing.Callable[[typing.Type[Comman
     """
 
     def _decorator(clazz: typing.Type[Command]) -> typing.Type[Command]:
-        def _predicate(member: typing.Any) -> bool:
-            return callable(member) and hasattr(member, HANDLER_ATTR_NAME)
-
-        # get all the methods decorated with our handler meta-data
-        handler_methods = inspect.getmembers(clazz, predicate=_predicate)
+        # get all the methods decorated with our handler meta-data by walking the class
+        # dictionaries directly - unlike inspect.getmembers this doesn't getattr every
+        # attribute of every base, and it can stop before reaching object
+        handler_methods = []
+        seen = set()
+        for klass in clazz.__mro__:
+            if klass is object:
+                break
+            for method_name, member in vars(klass).items():
+                if method_name in seen:
+                    continue
+                seen.add(method_name)
+                # unwrap staticmethod/classmethod to reach the decorated function
+                method = getattr(member, '__func__', member)
+                if callable(method) and hasattr(method, HANDLER_ATTR_NAME):
+                    handler_methods.append((method_name, method))
+        # getmembers returned members sorted by name, preserve that as the default order
+        handler_methods.sort(key=lambda entry: entry[0])
 
         # extract the meta-data from the methods
         handlers_with_data = [
@@ -138,9 +170,13 @@ def command(*, name: str, help_text: str) -> typing.Callable[[typing.Type[Comman
         elif any_have_order:
             raise Exception("if you mark any handler with an order, you must mark all with an order")
 
-        # record the method names, in whatever order we've determined so far, for use in the
-        # auto-generated `register_handlers` method below
-        handler_method_names = [method_name for method_name, _, _ in handlers_with_data]
+        # record the method names and their matchers, in whatever order we've determined so
+        # far, for use in the auto-generated `register_handlers` method below - extracting
+        # the matchers here saves re-reading the meta-data on every registration
+        handler_registrations = [
+            (method_name, handler_data.matcher)
+            for method_name, _, handler_data in handlers_with_data
+        ]
 
         # build the auto-generated class, inherited from the decorated class, implementing the
         # methods from the `Command` class
@@ -156,13 +192,11 @@ def command(*, name: str, help_text: str) -> typing.Callable[[typing.Type[Comman
                 # ensure any implementation by the decorated class is preserved
                 super().register_handlers(register)
 
-                # go through the method names we calculated earlier, extract the
-                # meta-data we attached to the methods and use it to register the
-                # method as a handler, using the matcher we stored in the meta-data
-                for method_name in handler_method_names:
-                    method = getattr(self, method_name)
-                    handler_data = getattr(method, HANDLER_ATTR_NAME)
-                    register(handler_data.matcher, method)
+                # go through the registrations we calculated earlier and register
+                # each method as a handler with the matcher we extracted from its
+                # meta-data
+                for method_name, matcher in handler_registrations:
+                    register(matcher, getattr(self, method_name))
 
         return _Wrapped
 
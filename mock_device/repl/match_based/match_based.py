@@ -1,11 +1,17 @@
+import logging
 import typing
 
 from mock_device.parse_command import CommandWord, CommandArguments
 from ..repl import Repl
 
 
+_LOG = logging.getLogger(__name__)
+
+
 Matcher = typing.Callable[[CommandWord, CommandArguments], bool]
-Handler = typing.Callable[[CommandWord, CommandArguments], typing.Awaitable]
+"""matchers may optionally carry a `key` attribute naming the command word they match on,
+allowing the REPL to index them for dispatch rather than trying each in turn"""
+Handler = typing.Callable[['MatchBasedRepl', CommandWord, CommandArguments], typing.Awaitable]
 RegisterHandler = typing.Callable[[Matcher, Handler], None]
 
 
@@ -22,8 +28,13 @@ class MatchBasedRepl(Repl):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.matchers: typing.List[KnownMatcher] = []
+        self.matchers: typing.Sequence[KnownMatcher] = []
+        # handlers whose matcher names the command word it matches on, indexed by that word,
+        # plus a fallback list of matchers that have to be tried against every command
+        self._by_word: typing.Dict[CommandWord, typing.Sequence[KnownMatcher]] = {}
+        self._unkeyed: typing.Sequence[KnownMatcher] = []
         self.register_handlers(self._register_handler)
+        self._freeze()
 
     def register_handlers(self, register: RegisterHandler):
         """method to be overriden by derived classes to register their handlers"""
@@ -35,26 +46,47 @@ class MatchBasedRepl(Repl):
         implements method inherited from parent
         """
 
-        print(f"{self.__class__.__name__}.handle_command: cmd='{cmd}' args={args}")
-        for matcher, handler in self.matchers:
-            print(f"  trying matcher: {matcher}")
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("%s.handle_command: cmd='%s' args=%s", self.__class__.__name__, cmd, args)
+        bucket = self._by_word.get(cmd, ())
+        for matcher, handler in bucket:
             if matcher(cmd, args):
-                print("    matched")
-                await handler(cmd, args)
-                break
-        else:
-            await self.unknown_command(cmd, args)
+                await handler(self, cmd, args)
+                return
+        for matcher, handler in self._unkeyed:
+            if matcher(cmd, args):
+                await handler(self, cmd, args)
+                return
+        await self.unknown_command(cmd, args)
 
     async def unknown_command(self, cmd: CommandWord, args: CommandArguments):
         """method that can be overriden by derived classes to handle commands which did not match any matchers"""
 
-        print(f"unhandled command '{cmd}': {args}")
+        _LOG.debug("unhandled command '%s': %s", cmd, args)
+
+    def _freeze(self):
+        """
+        converts the registration collections to tuples once registration is complete, as
+        they are only read from that point on; subclasses that need to register handlers
+        after construction can override this to a no-op
+        """
+
+        self.matchers = tuple(self.matchers)
+        self._by_word = {key: tuple(bucket) for key, bucket in self._by_word.items()}
+        self._unkeyed = tuple(self._unkeyed)
 
     def _register_handler(self, matcher: Matcher, handler: Handler):
         """
         used to register a handler and its matcher
         :param matcher: matcher that must match an input command to trigger this handler
-        :param handler: function to handle a command that matches the matcher
+        :param handler: function to handle a command that matches the matcher, called with
+            the REPL that dispatched the command as its first argument
         """
 
-        self.matchers.append(KnownMatcher(matcher, handler))
+        known = KnownMatcher(matcher, handler)
+        self.matchers.append(known)
+        key = getattr(matcher, 'key', None)
+        if key is not None:
+            self._by_word.setdefault(key, []).append(known)
+        else:
+            self._unkeyed.append(known)
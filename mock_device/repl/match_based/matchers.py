@@ -1,6 +1,24 @@
+import typing
+
 from mock_device.repl.match_based.match_based import Matcher
 
 
+class _LazyDescription:
+    """
+    defers building a matcher's human-readable description until it is actually
+    formatted (e.g. by an emitted debug log record), so that registering many
+    matchers doesn't build strings nobody will see
+    """
+
+    __slots__ = ('_build',)
+
+    def __init__(self, build: typing.Callable[[], str]):
+        self._build = build
+
+    def __str__(self):
+        return self._build()
+
+
 def match_on_cmd(expected_cmd: str) -> Matcher:
     """
     builds a matcher that handles commands if the command word matches
@@ -20,14 +38,12 @@ def match_on_cmd(expected_cmd: str) -> Matcher:
     True
     """
 
-    class _Matcher:
-        def __call__(self, cmd, _args):
-            return cmd == expected_cmd
-
-        def __str__(self):
-            return f"command word == '{expected_cmd}'"
+    def _matcher(cmd, _args, _expected=expected_cmd):
+        return cmd == _expected
 
-    return _Matcher()
+    _matcher.key = expected_cmd
+    _matcher.description = _LazyDescription(lambda: f"command word == '{expected_cmd}'")
+    return _matcher
 
 
 def match_on_cmd_starts_with(*expected_cmd: str) -> Matcher:
@@ -48,13 +64,14 @@ def match_on_cmd_starts_with(*expected_cmd: str) -> Matcher:
     False
     """
 
-    class _Matcher:
-        def __call__(self, cmd, args):
-            entire_cmd = [cmd] + args
-            parts_to_match = entire_cmd[:len(expected_cmd)]
-            return parts_to_match == list(expected_cmd)
+    # precompute what each call compares against so dispatch does no list building
+    head = expected_cmd[0]
+    tail = tuple(expected_cmd[1:])
+    tail_length = len(tail)
 
-        def __str__(self):
-            return f"command starts with '{' '.join(expected_cmd)}'"
+    def _matcher(cmd, args, _head=head, _tail=tail, _n=tail_length):
+        return cmd == _head and tuple(args[:_n]) == _tail
 
-    return _Matcher()
+    _matcher.key = head
+    _matcher.description = _LazyDescription(lambda: f"command starts with '{' '.join(expected_cmd)}'")
+    return _matcher
@@ -1,3 +1,4 @@
+import logging
 import typing
 
 from mock_device.parse_command import parse_command, CommandArguments, CommandWord
@@ -7,6 +8,9 @@ if typing.TYPE_CHECKING:
     from mock_device.client import Client
 
 
+_LOG = logging.getLogger(__name__)
+
+
 class Repl:
     """Represents a REPL (read-evaluate-print loop), a loop handling input commands and printing output"""
 
@@ -36,7 +40,8 @@ class Repl:
 
             command_word, args = parse_command(line)
 
-            print(f">>> {line}")
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug(">>> %s", line)
             if self.exit_command is not None and command_word == self.exit_command:
                 self.exit()
             else:
@@ -56,9 +61,10 @@ class Repl:
         """
 
         current = self
-        print(f"exiting repls until repl of type '{clazz.__name__}'")
-        while current is not None and not isinstance(current, clazz):
-            print(f"  exiting repl '{current.__class__.__name__}'")
+        _LOG.debug("exiting repls until repl of type '%s'", clazz.__name__)
+        # check for an exact type match first, it's cheaper than isinstance's MRO walk
+        while current is not None and type(current) is not clazz and not isinstance(current, clazz):
+            _LOG.debug("  exiting repl '%s'", current.__class__.__name__)
             current.exit()
             current = current.parent_repl
 
@@ -81,4 +87,4 @@ class Repl:
         :param args: the arguments supplied by the user (tokens following the first word)
         """
 
-        print(f"unhandled command '{cmd}': {args}")
+        _LOG.debug("unhandled command '%s': %s", cmd, args)